@@ -5,15 +5,24 @@
 # - All requested commands present
 # - Uses UTC internally for storage & scheduling
 
+import io
 import os
 import re
-import json
+import time
+import signal
+import orjson
+import heapq
+import atexit
 import asyncio
-import pytz
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
 import calendar
+from types import SimpleNamespace
+from functools import lru_cache
+from difflib import get_close_matches
+from collections import namedtuple
 
 
 # ------------------------------
@@ -35,14 +44,36 @@ CHANNEL_IDS = [int(x.strip()) for x in RAW_CHANNEL_IDS.split(",") if x.strip().i
 active_channels = set(CHANNEL_IDS)
 
 # Philippines timezone
-ph_tz = pytz.timezone("Asia/Manila")
+ph_tz = ZoneInfo("Asia/Manila")
+# Manila has been UTC+08:00 with no DST since 1978, so PH -> UTC is a constant shift
+_PH_OFFSET = timedelta(hours=8)
 
 # Files
 BOSSES_FILE = "bosses.json"
 DATA_FILE = "respawns.json"
+# Append-only change log replayed on top of DATA_FILE; folded back into DATA_FILE once it has
+# more than JOURNAL_COMPACT_FACTOR records per scheduled boss
+JOURNAL_FILE = "respawns.log"
+JOURNAL_COMPACT_FACTOR = 4
 
 # Default pre-alert (minutes before respawn)
 PRE_ALERT_MINUTES = 10
+# Live pre-alert setting; a mutable holder so !setprealert needs no `global` rebinding
+pre_alert = SimpleNamespace(minutes=PRE_ALERT_MINUTES)
+
+# Quiet period (seconds) after the last change before saving; bursts of changes coalesce into one write
+SAVE_DEBOUNCE_SECONDS = 0.5
+
+# fsync the respawn file before swapping it in (set DATA_FSYNC=0 in Railway for best-effort writes)
+DATA_FSYNC = os.getenv("DATA_FSYNC", "1") != "0"
+
+# Parsing patterns (compiled once; used per line in the bulk handlers)
+_DATE_HEADER_RE = re.compile(r"^(%s)\s+(\d{1,2})$" % "|".join(m for m in calendar.month_name if m), re.I)
+_MONTH_NUM = {m.lower(): i for i, m in enumerate(calendar.month_name) if m}
+_TIME_RE = re.compile(r"^(\d{1,2}):(\d{2})(?:\s*(am|pm))?$", re.I)
+# "time - boss", ignoring a trailing "(note)" such as "(ch2)"
+_LINE_RE = re.compile(r"^(\d{1,2}:\d{2}\s*(?:am|pm)?)\s*-\s*([^(]+?)\s*(?:\(.*\))?\s*$", re.I)
+_DEAD_ARGS_RE = re.compile(r"^(.+?)(?:\s+(\d{1,2}:\d{2}(?:\s*(?:am|pm))?))?$", re.I)
 
 # ------------------------------
 # Load boss definitions
@@ -50,11 +81,44 @@ PRE_ALERT_MINUTES = 10
 if not os.path.exists(BOSSES_FILE):
     raise FileNotFoundError(f"{BOSSES_FILE} not found — please ensure your bosses.json is present.")
 
-with open(BOSSES_FILE, "r", encoding="utf-8") as f:
-    BOSSES = json.load(f)
+# Boss record: interval in hours (None for fixed bosses), schedule as a tuple of "Day HH:MM" (may be empty),
+# the display name and joined schedule that the commands print, and the interval as a ready timedelta
+BossInfo = namedtuple("BossInfo", "interval schedule display schedule_str respawn_after")
+
+def _boss_info(name, d):
+    interval = d.get("interval")
+    schedule = tuple(d.get("schedule") or ())
+    return BossInfo(interval, schedule, name.capitalize(), ", ".join(schedule),
+                    timedelta(hours=interval) if interval else None)
+
+with open(BOSSES_FILE, "rb") as f:
+    BOSSES = {name: _boss_info(name, d) for name, d in orjson.loads(f.read()).items()}
+
+# Minimum similarity (0..1) for find_boss to accept a misspelled name
+FUZZY_CUTOFF = 0.8
+
+# Lowercase name -> BOSSES key, built once so find_boss doesn't re-lower every key per lookup
+BOSS_LOWER = {b.lower(): b for b in BOSSES}
+
+def _trigrams(s):
+    return {s[i:i + 3] for i in range(len(s) - 2)}
+
+# lowercase boss name -> whole-word pattern, for bulk lines that carry extra words
+BOSS_WORD_RE = {name: re.compile(r"(?<!\w)%s(?!\w)" % re.escape(name)) for name in BOSS_LOWER}
+
+# trigram -> lowercase boss names containing it; narrows find_boss's substring search
+BOSS_TRIGRAMS = {}
+for _name in BOSS_LOWER:
+    for _tg in _trigrams(_name):
+        BOSS_TRIGRAMS.setdefault(_tg, set()).add(_name)
+
+# (name, BossInfo) pairs for the !boss listing, split once into fixed-schedule and interval bosses;
+# interval bosses show under "No Info" whenever they have no timer
+FIXED_BOSSES = [(b, info) for b, info in BOSSES.items() if info.schedule]
+INTERVAL_BOSSES = [(b, info) for b, info in BOSSES.items() if not info.schedule]
 
 # ------------------------------
-# In-memory respawn schedule (boss -> UTC datetime)
+# In-memory respawn schedule (boss -> UTC epoch seconds; datetimes are only built for display)
 # ------------------------------
 respawn_schedule = {}
 
@@ -62,34 +126,172 @@ respawn_schedule = {}
 # Helpers
 # ------------------------------
 
+# Debounced writer state: a TimerHandle that each save pushes back, and the write in progress
+_save_handle = None
+_save_task = None
+_save_pending = False
+# schedule as it stands on disk (snapshot + journal); only the difference gets written
+_persisted = {}
+_journal_records = 0
+
+def _write_json_sync(payload):
+    """
+    Write a serialized schedule snapshot (bytes) to DATA_FILE (blocking; run off the event loop).
+    Writes to a temp file and renames it over DATA_FILE so a crash never leaves a truncated file.
+    """
+    tmp = DATA_FILE + ".tmp"
+    with open(tmp, "wb") as f:
+        f.write(payload)
+        if DATA_FSYNC:
+            f.flush()
+            os.fsync(f.fileno())
+    os.replace(tmp, DATA_FILE)
+
+def _compact_sync(payload):
+    """
+    Journal the pending records, replace DATA_FILE with a full snapshot, then empty the journal.
+    payload is (records, snapshot). Appending first keeps the journal's last word per boss equal
+    to the snapshot, so a crash anywhere before the truncate replays to the same state.
+    """
+    records, snapshot = payload
+    _append_journal_sync(records)
+    _write_json_sync(snapshot)
+    open(JOURNAL_FILE, "wb").close()
+
+def _append_journal_sync(payload):
+    """Append JSON-lines change records to JOURNAL_FILE (blocking; run off the event loop)."""
+    with open(JOURNAL_FILE, "ab") as f:
+        f.write(payload)
+        if DATA_FSYNC:
+            f.flush()
+            os.fsync(f.fileno())
+
+def _prepare_write():
+    """
+    Diff respawn_schedule against what's on disk (on the loop thread, so the worker never sees
+    a dict mid-mutation). Returns (write_fn, payload, new_state, journal_records) or None.
+    """
+    records = [{"b": boss, "t": dt} for boss, dt in respawn_schedule.items() if _persisted.get(boss) != dt]
+    records += [{"b": boss, "t": None} for boss in _persisted.keys() - respawn_schedule.keys()]
+    if not records:
+        return None
+    state = dict(respawn_schedule)
+    payload = b"".join(orjson.dumps(r) + b"\n" for r in records)
+    if _journal_records + len(records) > JOURNAL_COMPACT_FACTOR * len(state):
+        return _compact_sync, (payload, orjson.dumps(state)), state, 0
+    return _append_journal_sync, payload, state, _journal_records + len(records)
+
+def _commit_write(state, journal_records):
+    global _persisted, _journal_records
+    _persisted = state
+    _journal_records = journal_records
+
+async def _flush():
+    """Write pending changes in a worker thread; loops if more changes land mid-write."""
+    global _save_task, _save_pending
+    try:
+        while _save_pending:
+            _save_pending = False
+            pending = _prepare_write()
+            if pending is None:
+                continue
+            write, payload, state, journal_records = pending
+            await asyncio.to_thread(write, payload)
+            _commit_write(state, journal_records)
+    except Exception as e:
+        print(f"⚠️ Failed to save {DATA_FILE}: {e}")
+    finally:
+        _save_task = None
+
+def _start_flush():
+    """TimerHandle callback: the debounce window passed quietly, start writing."""
+    global _save_handle, _save_task
+    _save_handle = None
+    # a write already in progress will pick up the pending flag itself
+    if _save_task is None:
+        _save_task = asyncio.create_task(_flush())
+
 def save_respawn_data():
-    """Persist respawn_schedule to disk (ISO format)."""
-    with open(DATA_FILE, "w", encoding="utf-8") as f:
-        json.dump({boss: dt.isoformat() for boss, dt in respawn_schedule.items()}, f)
+    """
+    Mark respawn_schedule as changed and (re)arm the debounced write, so a burst of changes
+    (bulk commands, alerts firing together) lands on disk as one write.
+    Must be called from within the running event loop.
+    """
+    global _save_handle, _save_pending
+    _save_pending = True
+    if _save_handle is not None:
+        _save_handle.cancel()
+    _save_handle = asyncio.get_running_loop().call_later(SAVE_DEBOUNCE_SECONDS, _start_flush)
+
+def flush_respawn_data():
+    """Write any pending changes synchronously (used on shutdown)."""
+    global _save_pending
+    if _save_pending:
+        _save_pending = False
+        pending = _prepare_write()
+        if pending is not None:
+            write, payload, state, journal_records = pending
+            write(payload)
+            _commit_write(state, journal_records)
+
+def _parse_saved_time(value):
+    """Turn a saved value (epoch seconds, or an ISO string from older files) into epoch seconds."""
+    if isinstance(value, (int, float)):
+        # epoch seconds: stored as-is, no parsing
+        return float(value)
+    dt = datetime.fromisoformat(value)
+    # If it's naive (no tz), assume UTC
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
 
 def load_respawn_data():
-    """Load persisted respawn schedule (if present) and normalize to UTC-aware datetimes."""
-    if not os.path.exists(DATA_FILE):
-        return
-    with open(DATA_FILE, "r", encoding="utf-8") as f:
-        raw = json.load(f)
-    for boss, iso in raw.items():
-        try:
-            dt = datetime.fromisoformat(iso)
-            # If it's naive (no tz), assume UTC
-            if dt.tzinfo is None:
-                dt = dt.replace(tzinfo=pytz.UTC)
-            # normalize to pytz.UTC
-            dt = dt.astimezone(pytz.UTC)
-            respawn_schedule[boss] = dt
-        except Exception:
-            # skip broken entries
-            print(f"⚠️ Could not parse saved time for {boss}: {iso}")
-
-def format_countdown(respawn_time):
-    """Return countdown like '2h 15m' or '⏳ Any moment now!'."""
-    now = datetime.utcnow().replace(tzinfo=pytz.UTC)
-    remaining = (respawn_time - now).total_seconds()
+    """
+    Load the persisted snapshot (if present), replay the journal on top of it and
+    normalize everything to UTC epoch seconds.
+    """
+    journal_records = 0
+    if os.path.exists(DATA_FILE):
+        with open(DATA_FILE, "rb") as f:
+            raw = orjson.loads(f.read())
+        for boss, value in raw.items():
+            try:
+                respawn_schedule[boss] = _parse_saved_time(value)
+            except Exception:
+                # skip broken entries
+                print(f"⚠️ Could not parse saved time for {boss}: {value}")
+    if os.path.exists(JOURNAL_FILE):
+        with open(JOURNAL_FILE, "rb") as f:
+            for line in f:
+                try:
+                    rec = orjson.loads(line)
+                    if rec["t"] is None:
+                        respawn_schedule.pop(rec["b"], None)
+                    else:
+                        respawn_schedule[rec["b"]] = _parse_saved_time(rec["t"])
+                    journal_records += 1
+                except Exception:
+                    # skip broken records (e.g. a torn last line after a crash)
+                    print(f"⚠️ Could not parse journal record: {line!r}")
+    _commit_write(dict(respawn_schedule), journal_records)
+    # bosses removed from bosses.json can't be displayed or alerted; dropping them after the
+    # commit above means the next save journals their removal
+    for boss in respawn_schedule.keys() - BOSSES.keys():
+        print(f"⚠️ Dropping saved timer for unknown boss: {boss}")
+        del respawn_schedule[boss]
+
+def _now():
+    """Current time as an aware UTC datetime (single call, no naive -> aware replace)."""
+    return datetime.now(timezone.utc)
+
+def format_countdown(respawn_ts, now_ts=None):
+    """
+    Return countdown like '2h 15m' or '⏳ Any moment now!' for an epoch-seconds respawn time.
+    Pass `now_ts` when formatting many rows so they share one clock snapshot.
+    """
+    if now_ts is None:
+        now_ts = time.time()
+    remaining = respawn_ts - now_ts
     if remaining <= 0:
         return "⏳ Any moment now!"
     minutes = int(remaining // 60)
@@ -101,46 +303,162 @@ def format_countdown(respawn_time):
     if minutes: parts.append(f"{minutes}m")
     return " ".join(parts) if parts else "0m"
 
-def find_boss(query: str):
+def format_ph_datetime(dt):
+    """Render an aware datetime as PH time, e.g. '2025-09-22 05:04 AM PH' (ints, not strftime)."""
+    ph = dt.astimezone(ph_tz)
+    hour = ph.hour
+    return (f"{ph.year:04d}-{ph.month:02d}-{ph.day:02d} "
+            f"{hour % 12 or 12:02d}:{ph.minute:02d} {'AM' if hour < 12 else 'PM'} PH")
+
+# boss -> (respawn_ts, rendered row prefix); one slot per boss, so a new timer simply overwrites it
+_row_prefix_cache = {}
+
+def format_timer_row(boss, respawn_ts, now_ts):
+    """Render one !boss timer row, e.g. '**3:56 am** — Ego *(in 20h 59m)*'."""
+    cached = _row_prefix_cache.get(boss)
+    if cached is not None and cached[0] == respawn_ts:
+        prefix = cached[1]
+    else:
+        # one datetime per timer; build "h:mm am" from ints instead of strftime
+        ph_time = datetime.fromtimestamp(respawn_ts, ph_tz)
+        hour = ph_time.hour
+        clock = f"{hour % 12 or 12}:{ph_time.minute:02d} {'am' if hour < 12 else 'pm'}"
+        prefix = f"**{clock}** — {BOSSES[boss].display} *(in "
+        _row_prefix_cache[boss] = (respawn_ts, prefix)
+    # only the countdown changes between renders
+    return f"{prefix}{format_countdown(respawn_ts, now_ts)})*"
+
+# Discord rejects messages longer than this
+MESSAGE_LIMIT = 2000
+# Embed limits: characters per field value, fields per embed, characters across the whole embed
+EMBED_FIELD_LIMIT = 1024
+EMBED_MAX_FIELDS = 25
+EMBED_TOTAL_LIMIT = 6000
+
+def chunk_lines(lines, limit=MESSAGE_LIMIT):
+    """Group lines into newline-joined messages of at most `limit` characters each."""
+    chunk, size = [], 0
+    for line in lines:
+        # +1 for the joining newline
+        if chunk and size + len(line) + 1 > limit:
+            yield "\n".join(chunk)
+            chunk, size = [], 0
+        chunk.append(line[:limit])
+        size += len(line) + 1
+    if chunk:
+        yield "\n".join(chunk)
+
+async def send_results(ctx, title, results):
+    """
+    Send bulk command results as one embed, one field per group of lines under the field limit.
+    If they would overflow even an embed, attach them as results.txt in a single message instead.
+    """
+    if not results:
+        await ctx.send("❌ No valid entries found.")
+        return
+    groups = list(chunk_lines(results, EMBED_FIELD_LIMIT))
+    n = len(groups)
+    names = [f"Results ({i}/{n})" if n > 1 else "Results" for i in range(1, n + 1)]
+    total = len(title) + sum(map(len, groups)) + sum(map(len, names))
+    if n <= EMBED_MAX_FIELDS and total <= EMBED_TOTAL_LIMIT:
+        embed = discord.Embed(title=title)
+        for name, group in zip(names, groups):
+            embed.add_field(name=name, value=group, inline=False)
+        await ctx.send(embed=embed)
+        return
+    report = io.BytesIO("\n".join(results).encode())
+    await ctx.send(f"**{title}** ({len(results)} lines)", file=discord.File(report, filename="results.txt"))
+
+def find_boss(query: str, contained=False, fuzzy=False):
     """
     Find a boss by partial/case-insensitive match.
     Returns the boss key from BOSSES (lowercase as in JSON) or None.
+    With contained=True (bulk lines only), a query carrying extra words such as
+    "lady dalia ch2" also resolves to a boss whose whole name appears in it.
+    With fuzzy=True (read-only lookups only), a misspelled name resolves to the closest boss;
+    commands that record kills leave it off and suggest the name instead.
     """
+    matches = boss_matches(query, contained, fuzzy)
+    # no unique match -> None
+    return matches[0] if len(matches) == 1 else None
+
+def boss_matches(query: str, contained=False, fuzzy=False):
+    """All BOSSES keys a query could mean, sorted (empty if none, several if ambiguous)."""
     if not query:
-        return None
-    q = query.strip().lower()
+        return ()
+    return _boss_matches_lower(query.strip().lower(), contained, fuzzy)
+
+# BOSSES never changes after load, so a normalized query always resolves the same way
+@lru_cache(maxsize=512)
+def _boss_matches_lower(q, contained, fuzzy):
     # exact
-    if q in BOSSES:
-        return q
-    matches = [b for b in BOSSES.keys() if q in b.lower()]
-    if len(matches) == 1:
-        return matches[0]
-    # no unique match
-    return None
+    exact = BOSS_LOWER.get(q)
+    if exact:
+        return (exact,)
+    matches = [name for name in _substring_candidates(q) if q in name]
+    if not matches and contained:
+        # look for a whole boss name inside the query ("diego" must not hit "ego")
+        matches = [name for name, word_re in BOSS_WORD_RE.items() if word_re.search(q)]
+    if not matches and fuzzy:
+        # last resort for typos ("venatis", "clemantes"): the single closest name, if close enough
+        matches = get_close_matches(q, BOSS_LOWER, n=1, cutoff=FUZZY_CUTOFF)
+    return tuple(sorted(BOSS_LOWER[name] for name in matches))
+
+def unknown_boss_message(query: str, contained=False):
+    """
+    Reply for a query find_boss couldn't resolve: list the candidates if it was ambiguous,
+    or suggest the closest name if it looks like a typo.
+    """
+    matches = boss_matches(query, contained)
+    if len(matches) > 1:
+        return f"❓ Ambiguous boss `{query}` — did you mean: {', '.join(BOSSES[b].display for b in matches)}?"
+    suggestion = find_boss(query, contained, fuzzy=True)
+    if suggestion:
+        return f"❌ Unknown boss: `{query}` — did you mean **{BOSSES[suggestion].display}**?"
+    return f"❌ Unknown boss: `{query}`"
+
+def _substring_candidates(q):
+    """
+    Lowercase boss names that could contain q. A substring match must contain every trigram
+    of the query, so intersect the posting sets and leave only a few names to verify.
+    """
+    if len(q) < 3:
+        return BOSS_LOWER
+    candidates = None
+    for tg in _trigrams(q):
+        names = BOSS_TRIGRAMS.get(tg)
+        if not names:
+            return ()
+        candidates = names if candidates is None else candidates & names
+    return candidates
 
 def parse_date_header(line: str):
     """
     Parse date header like "September 22" and return a date() with the current year applied.
     Returns None if it doesn't match.
     """
+    # "<month> <day>" straight from the regex groups — no strptime, no exception for time lines
+    m = _DATE_HEADER_RE.match(line.strip())
+    if not m:
+        return None
     try:
-        parsed = datetime.strptime(line.strip(), "%B %d").date()  # year is 1900 initially
         # attach current PH year (user likely means this year)
-        current_year = datetime.now(ph_tz).year
-        return parsed.replace(year=current_year)
-    except Exception:
+        return date(datetime.now(ph_tz).year, _MONTH_NUM[m.group(1).lower()], int(m.group(2)))
+    except ValueError:
+        # e.g. "February 30"
         return None
 
+# (time string, date) pairs repeat across bulk pastes; both args and the result are immutable
+@lru_cache(maxsize=256)
 def parse_time_to_utc(time_str: str, base_date):
     """
     Parse a time string like "5:04 am", "17:07", "6:51 pm" with given base_date (a date object),
-    return a timezone-aware UTC datetime (pytz.UTC) or None on failure.
+    return a timezone-aware UTC datetime or None on failure.
     """
     if not time_str or not base_date:
         return None
-    s = time_str.strip().lower()
-    # Regex: hh:mm optional am/pm
-    m = re.match(r"^(\d{1,2}):(\d{2})(?:\s*(am|pm))?$", s, re.I)
+    # hh:mm optional am/pm (_TIME_RE is case-insensitive; only the am/pm group gets lowered)
+    m = _TIME_RE.match(time_str.strip())
     if not m:
         return None
     hour = int(m.group(1))
@@ -150,20 +468,12 @@ def parse_time_to_utc(time_str: str, base_date):
         hour += 12
     if ampm == "am" and hour == 12:
         hour = 0
-    # build naive local dt using base_date
+    # build the PH wall-clock time as UTC and shift by the fixed offset (one allocation, no tz lookup)
     try:
-        naive = datetime(year=base_date.year, month=base_date.month, day=base_date.day,
-                         hour=hour, minute=minute)
+        return datetime(year=base_date.year, month=base_date.month, day=base_date.day,
+                        hour=hour, minute=minute, tzinfo=timezone.utc) - _PH_OFFSET
     except Exception:
         return None
-    # localize properly using pytz
-    try:
-        local_dt = ph_tz.localize(naive)
-    except Exception:
-        # fallback (shouldn't usually happen)
-        local_dt = naive.replace(tzinfo=ph_tz)
-    # convert to UTC for storage/comparison
-    return local_dt.astimezone(pytz.UTC)
 
 def get_active_channel_objs():
     """
@@ -215,7 +525,7 @@ def get_next_fixed_schedule(boss, schedules):
         return None
 
     # Return the soonest upcoming time converted to UTC
-    return min(upcoming_times).astimezone(pytz.UTC)
+    return min(upcoming_times).astimezone(timezone.utc)
 
 # ------------------------------
 # Bot initialization
@@ -229,62 +539,159 @@ bot = commands.Bot(command_prefix="!", intents=intents, help_command=None)
 # Scheduler + Announcer
 # ------------------------------
 
-def schedule_boss(boss: str, respawn_utc: datetime):
+# All pending alerts live in one heap of (when_epoch, kind, boss, generation), where kind is
+# "pre" (pre-alert) or "spawn" (final alert). A single dispatcher loop (discord.ext.tasks) sleeps
+# until the earliest entry instead of keeping one sleeping task per boss. Rescheduling a boss
+# bumps its generation, so superseded heap entries are simply skipped when they come due.
+_timer_heap = []
+_timer_gen = {}
+_wake = asyncio.Event()
+# asyncio timers can wake up to one clock tick early; pad waits so a due entry is really due
+_CLOCK_RESOLUTION = time.get_clock_info("monotonic").resolution
+
+# Due alerts are queued as (kind, boss) and sent by one batcher, which folds everything that
+# comes due within ALERT_BATCH_SECONDS of the first queued alert into one message per kind and channel.
+ALERT_BATCH_SECONDS = 2
+pending_spawn_alerts = asyncio.Queue()
+
+def schedule_boss(boss: str, spawn_at: float):
     """
-    Wrapper that schedules announce_boss to run in the background.
-    Expects respawn_utc to be an aware datetime in UTC (pytz.UTC).
+    Queue the pre-alert and final alert for a boss on the dispatcher heap.
+    Expects spawn_at as UTC epoch seconds (the same value respawn_schedule stores).
+    Callers are responsible for calling save_respawn_data() afterwards.
     """
-    # ensure stored
-    respawn_schedule[boss] = respawn_utc
-    save_respawn_data()
-    # create the background task
-    asyncio.create_task(announce_boss(boss, respawn_utc))
+    respawn_schedule[boss] = spawn_at
+    gen = _timer_gen.get(boss, 0) + 1
+    _timer_gen[boss] = gen
+
+    pre_at = spawn_at - pre_alert.minutes * 60
+    # pre-alert only if it's still ahead of us
+    if pre_at > time.time():
+        heapq.heappush(_timer_heap, (pre_at, "pre", boss, gen))
+    heapq.heappush(_timer_heap, (spawn_at, "spawn", boss, gen))
+    _wake.set()
+
+@tasks.loop()
+async def dispatcher():
+    """
+    Back-to-back discord.py loop (restarted on transient connection errors): queue due heap
+    entries, then sleep until the next one or until schedule_boss() wakes us.
+    """
+    _wake.clear()
+    now = time.time()
+    while _timer_heap and _timer_heap[0][0] <= now:
+        _, kind, boss, gen = heapq.heappop(_timer_heap)
+        if _timer_gen.get(boss) != gen:
+            # superseded by a newer schedule for this boss
+            continue
+        if kind == "spawn":
+            # the timer is done; drop it now so !boss/!next stop showing it
+            del _timer_gen[boss]
+            if respawn_schedule.pop(boss, None) is not None:
+                save_respawn_data()
+        pending_spawn_alerts.put_nowait((kind, boss))
+        # cooperative yield while draining a backlog (e.g. after a restart). Use sleep(0) for
+        # yield points — CPython special-cases it as a bare reschedule with no timer, unlike sleep(0.001)
+        await asyncio.sleep(0)
+
+    timeout = max(_timer_heap[0][0] - time.time(), 0) + _CLOCK_RESOLUTION if _timer_heap else None
+    try:
+        await asyncio.wait_for(_wake.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        pass
+
+@tasks.loop()
+async def alert_batcher():
+    """
+    Back-to-back discord.py loop: collect alerts for ALERT_BATCH_SECONDS after the first one,
+    then send them combined. The window is fixed, so a steady trickle can't hold alerts back.
+    """
+    kind, boss = await pending_spawn_alerts.get()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + ALERT_BATCH_SECONDS
+    batch = {"pre": [], "spawn": []}
+    batch[kind].append(boss)
+    while True:
+        try:
+            kind, boss = await asyncio.wait_for(pending_spawn_alerts.get(), timeout=max(0, deadline - loop.time()))
+        except asyncio.TimeoutError:
+            break
+        batch[kind].append(boss)
 
-async def announce_boss(boss: str, respawn_utc: datetime):
-    if respawn_utc.tzinfo is None:
-        respawn_utc = respawn_utc.replace(tzinfo=pytz.UTC)
-    now = datetime.utcnow().replace(tzinfo=pytz.UTC)
+    for kind, bosses in batch.items():
+        if not bosses:
+            continue
+        try:
+            await announce_bosses(kind, bosses)
+        except Exception as e:
+            print(f"⚠️ Failed to announce {', '.join(bosses)} ({kind}): {e}")
+
+def start_background_tasks():
+    """Start the dispatcher and alert batcher once (on_ready can fire again after reconnects)."""
+    if not dispatcher.is_running():
+        dispatcher.start()
+    if not alert_batcher.is_running():
+        alert_batcher.start()
+
+async def send_to_channels(channels, content, what):
+    """Send `content` to all channels concurrently; a failing channel is logged, not fatal."""
+    results = await asyncio.gather(*(ch.send(content) for ch in channels), return_exceptions=True)
+    for ch, res in zip(channels, results):
+        if isinstance(res, Exception):
+            print(f"⚠️ Failed to send {what} to {ch.id}: {res}")
+
+async def announce_bosses(kind: str, bosses):
+    """Send one pre-alert ("pre") or final respawn alert ("spawn") covering `bosses` to all active channels."""
+    channels = get_active_channel_objs()
 
     # Build mention string
     mention_str = "@everyone"
     if ROLE_ID:
-        for ch in get_active_channel_objs():
+        for ch in channels:
             role = ch.guild.get_role(ROLE_ID)
             if role:
                 mention_str = role.mention
                 break
 
+    names = ", ".join(BOSSES[b].display for b in bosses)
+
     # Pre-alert
-    alert_time = respawn_utc - timedelta(minutes=PRE_ALERT_MINUTES)
-    wait = (alert_time - now).total_seconds()
-    if wait > 0:
-        await asyncio.sleep(wait)
-        for ch in get_active_channel_objs():
-            try:
-                await ch.send(f"⏳ {mention_str} **{boss.capitalize()} will respawn in {PRE_ALERT_MINUTES} minutes!** Get ready!")
-            except Exception as e:
-                print(f"⚠️ Failed to send pre-alert to {ch.id}: {e}")
+    if kind == "pre":
+        minutes = pre_alert.minutes
+        await send_to_channels(channels, f"⏳ {mention_str} **{names} will respawn in {minutes} minutes!** Get ready!", "pre-alert")
+        return
 
     # Final alert
-    now = datetime.utcnow().replace(tzinfo=pytz.UTC)
-    wait = (respawn_utc - now).total_seconds()
-    if wait > 0:
-        await asyncio.sleep(wait)
-    for ch in get_active_channel_objs():
-        try:
-            await ch.send(f"⚔️ {mention_str} **{boss.capitalize()} has respawned!** Go hunt!")
-        except Exception as e:
-            print(f"⚠️ Failed to send final alert to {ch.id}: {e}")
-
-    # Cleanup
-    if boss in respawn_schedule:
-        del respawn_schedule[boss]
-        save_respawn_data()
+    verb = "has" if len(bosses) == 1 else "have"
+    await send_to_channels(channels, f"⚔️ {mention_str} **{names} {verb} respawned!** Go hunt!", "final alert")
 
 # ------------------------------
 # Events
 # ------------------------------
 
+# the SIGTERM close task; held here because the event loop only keeps a weak reference to tasks
+_close_task = None
+
+def _close_on_sigterm():
+    global _close_task
+    if _close_task is None:
+        _close_task = asyncio.create_task(bot.close())
+
+@bot.event
+async def setup_hook():
+    """
+    Runs once before the gateway connects. Load the saved schedule in a worker thread
+    so file I/O and parsing never run on the event loop.
+    """
+    await asyncio.to_thread(load_respawn_data)
+    # the worker is stopped with SIGTERM, which would kill the process without running atexit;
+    # close the client instead so bot.run() returns and flush_respawn_data() writes pending saves
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, _close_on_sigterm)
+    except NotImplementedError:
+        # Windows event loops have no signal handlers; Ctrl+C still unwinds through bot.run()
+        pass
+
 @bot.event
 async def on_ready():
     """
@@ -304,18 +711,24 @@ async def on_ready():
                     print(f"📡 Auto-added channel {ch.name} ({ch.id}) from guild {guild.name}")
                     break
 
-    # Resume tasks for saved respawns (future only)
-    now = datetime.utcnow().replace(tzinfo=pytz.UTC)
-    for boss, dt in list(respawn_schedule.items()):
-        if dt and dt.tzinfo is None:
-            dt = dt.replace(tzinfo=pytz.UTC)
-        if dt > now:
-            # call wrapper that schedules announce_boss
-            schedule_boss(boss, dt)
-        else:
-            # expired entry — clean up
-            del respawn_schedule[boss]
-            save_respawn_data()
+    # Single alert dispatcher + batcher for every scheduled boss
+    start_background_tasks()
+
+    # Resume alerts for saved respawns (future only). Bosses already on the dispatcher heap
+    # (on_ready fires again after reconnects) are left alone instead of being re-pushed.
+    now = time.time()
+    expired = []
+    for boss, ts in respawn_schedule.items():
+        if ts <= now:
+            # expired entry — clean up after the scan
+            expired.append(boss)
+        elif boss not in _timer_gen:
+            # queue its alerts on the dispatcher heap
+            schedule_boss(boss, ts)
+    if expired:
+        for boss in expired:
+            respawn_schedule.pop(boss, None)
+        save_respawn_data()
 
 # ------------------------------
 # Commands (all required present)
@@ -349,14 +762,17 @@ async def up(ctx, *, bulk: str = None):
         return
 
     results = []
+    # boss -> latest respawn time in this paste (a corrected re-log overrides the earlier line)
+    latest = {}
     for line in lines[1:]:
-        if "-" not in line:
+        m = _LINE_RE.match(line)
+        if not m:
             results.append(f"⚠️ Could not parse line: `{line}`")
             continue
-        time_part, boss_part = [p.strip() for p in line.split("-", 1)]
-        boss_key = find_boss(boss_part)
+        time_part, boss_part = m.groups()
+        boss_key = find_boss(boss_part, contained=True)
         if not boss_key:
-            results.append(f"❌ Unknown boss: `{boss_part}`")
+            results.append(unknown_boss_message(boss_part, contained=True))
             continue
 
         # parse time + produce UTC datetime (the given time is expected to be PH local time)
@@ -366,18 +782,22 @@ async def up(ctx, *, bulk: str = None):
             continue
 
         # If boss is fixed schedule (no interval), inform user and skip
-        if BOSSES.get(boss_key, {}).get("schedule"):
-            results.append(f"🗓️ {boss_key.capitalize()} is fixed-schedule: {', '.join(BOSSES[boss_key]['schedule'])}")
+        info = BOSSES[boss_key]
+        if info.schedule:
+            results.append(f"🗓️ {info.display} is fixed-schedule: {info.schedule_str}")
             continue
 
-        # store & schedule
-        respawn_schedule[boss_key] = respawn_utc
+        # scheduled & persisted once after the loop
+        latest[boss_key] = respawn_utc.timestamp()
+        ph_str = format_ph_datetime(respawn_utc)
+        results.append(f"✅ {info.display} set → {ph_str}")
+
+    if latest:
+        for boss, spawn_at in latest.items():
+            schedule_boss(boss, spawn_at)
         save_respawn_data()
-        schedule_boss(boss_key, respawn_utc)
-        ph_str = respawn_utc.astimezone(ph_tz).strftime("%Y-%m-%d %I:%M %p PH")
-        results.append(f"✅ {boss_key.capitalize()} set → {ph_str}")
 
-    await ctx.send("\n".join(results) if results else "❌ No valid entries found.")
+    await send_results(ctx, "🕒 !up results", results)
 
 # 2) !dead — single boss dead (optional time). If time omitted, use now PH
 @bot.command(name="dead")
@@ -396,21 +816,27 @@ async def dead(ctx, *, args: str = None):
 
     # split boss name and optional time (split from the end)
     # Accept: "lady dalia 5:30 pm" or "venatus 01:15"
-    m = re.match(r"^(.+?)(?:\s+(\d{1,2}:\d{2}(?:\s*(?:am|pm))?))?$", args.strip(), re.I)
+    m = _DEAD_ARGS_RE.match(args.strip())
     if not m:
         await ctx.send("❌ Couldn't parse input. Use `!dead <boss> [HH:MM]`")
         return
     boss_part = m.group(1).strip()
     time_part = (m.group(2) or "").strip() or None
+    # boss names have no digits: a leftover one is a time _DEAD_ARGS_RE couldn't split off
+    # ("venatus 5pm", "venatus 17.30"); don't silently log it as "now"
+    if any(ch.isdigit() for ch in boss_part):
+        await ctx.send("❌ Invalid time format. Use `HH:MM` or `HH:MM AM/PM`.")
+        return
 
     boss_key = find_boss(boss_part)
     if not boss_key:
-        await ctx.send(f"❌ Unknown boss: `{boss_part}`")
+        await ctx.send(unknown_boss_message(boss_part))
         return
 
     # If fixed schedule boss, show schedule
-    if BOSSES.get(boss_key, {}).get("schedule"):
-        await ctx.send(f"🗓️ {boss_key.capitalize()} is fixed-schedule: {', '.join(BOSSES[boss_key]['schedule'])}")
+    info = BOSSES[boss_key]
+    if info.schedule:
+        await ctx.send(f"🗓️ {info.display} is fixed-schedule: {info.schedule_str}")
         return
 
     # Determine killed time in PH (then convert to UTC)
@@ -420,22 +846,20 @@ async def dead(ctx, *, args: str = None):
             await ctx.send("❌ Invalid time format. Use `HH:MM` or `HH:MM AM/PM`.")
             return
     else:
-        # now in PH -> convert to UTC
-        killed_utc = datetime.now(ph_tz).astimezone(pytz.UTC)
+        # now — already UTC, no PH round-trip needed
+        killed_utc = _now()
 
-    interval = BOSSES[boss_key].get("interval")
-    if not interval:
-        await ctx.send(f"🗓️ {boss_key.capitalize()} is fixed-schedule: {', '.join(BOSSES[boss_key]['schedule'])}")
+    if not info.interval:
+        await ctx.send(f"🗓️ {info.display} is fixed-schedule: {info.schedule_str}")
         return
 
-    respawn_utc = killed_utc + timedelta(hours=interval)
-    respawn_schedule[boss_key] = respawn_utc
+    respawn_utc = killed_utc + info.respawn_after
+    schedule_boss(boss_key, respawn_utc.timestamp())
     save_respawn_data()
-    schedule_boss(boss_key, respawn_utc)
 
-    killed_ph_str = killed_utc.astimezone(ph_tz).strftime("%Y-%m-%d %I:%M %p PH")
-    respawn_ph_str = respawn_utc.astimezone(ph_tz).strftime("%Y-%m-%d %I:%M %p PH")
-    await ctx.send(f"✅ {boss_key.capitalize()} marked dead at {killed_ph_str} → Respawns at {respawn_ph_str}")
+    killed_ph_str = format_ph_datetime(killed_utc)
+    respawn_ph_str = format_ph_datetime(respawn_utc)
+    await ctx.send(f"✅ {info.display} marked dead at {killed_ph_str} → Respawns at {respawn_ph_str}")
 
 # 3) !deadat — bulk dead (can accept a date header optionally)
 @bot.command(name="deadat")
@@ -467,18 +891,22 @@ async def deadat(ctx, *, bulk: str = None):
         base_date = datetime.now(ph_tz).date()
 
     results = []
+    # boss -> latest respawn time in this paste (a corrected re-log overrides the earlier line)
+    latest = {}
     for line in lines:
-        if "-" not in line:
+        m = _LINE_RE.match(line)
+        if not m:
             results.append(f"⚠️ Could not parse line: `{line}`")
             continue
-        time_part, boss_part = [p.strip() for p in line.split("-", 1)]
-        boss_key = find_boss(boss_part)
+        time_part, boss_part = m.groups()
+        boss_key = find_boss(boss_part, contained=True)
         if not boss_key:
-            results.append(f"❌ Unknown boss: `{boss_part}`")
+            results.append(unknown_boss_message(boss_part, contained=True))
             continue
 
-        if BOSSES.get(boss_key, {}).get("schedule"):
-            results.append(f"🗓️ {boss_key.capitalize()} is fixed-schedule: {', '.join(BOSSES[boss_key]['schedule'])}")
+        info = BOSSES[boss_key]
+        if info.schedule:
+            results.append(f"🗓️ {info.display} is fixed-schedule: {info.schedule_str}")
             continue
 
         killed_utc = parse_time_to_utc(time_part, base_date)
@@ -486,19 +914,21 @@ async def deadat(ctx, *, bulk: str = None):
             results.append(f"❌ Invalid time: `{time_part}`")
             continue
 
-        interval = BOSSES[boss_key].get("interval")
-        if not interval:
-            results.append(f"🗓️ {boss_key.capitalize()} is fixed-schedule.")
+        if not info.interval:
+            results.append(f"🗓️ {info.display} is fixed-schedule.")
             continue
 
-        respawn_utc = killed_utc + timedelta(hours=interval)
-        respawn_schedule[boss_key] = respawn_utc
+        respawn_utc = killed_utc + info.respawn_after
+        latest[boss_key] = respawn_utc.timestamp()
+        ph_str = format_ph_datetime(respawn_utc)
+        results.append(f"✅ {info.display} set → {ph_str}")
+
+    if latest:
+        for boss, spawn_at in latest.items():
+            schedule_boss(boss, spawn_at)
         save_respawn_data()
-        schedule_boss(boss_key, respawn_utc)
-        ph_str = respawn_utc.astimezone(ph_tz).strftime("%Y-%m-%d %I:%M %p PH")
-        results.append(f"✅ {boss_key.capitalize()} set → {ph_str}")
 
-    await ctx.send("\n".join(results) if results else "❌ No valid entries found.")
+    await send_results(ctx, "💀 !deadat results", results)
 
 # 4) !boss & !boss soon — list timers (with separation of fixed/no-info)
 @bot.command(name="boss")
@@ -508,55 +938,48 @@ async def boss_list(ctx, option: str = None):
       !boss      -> show all (active + fixed/no info)
       !boss soon -> show next 5 upcoming respawns only + separate fixed list
     """
-    now = datetime.utcnow().replace(tzinfo=pytz.UTC)
+    now = time.time()
     with_timers = []
-    without_timers = []
-
-    for boss, data in BOSSES.items():
-        if boss in respawn_schedule:
-            rt = respawn_schedule[boss]
-            if rt and rt.tzinfo is None:
-                rt = rt.replace(tzinfo=pytz.UTC)
-            if rt > now:
-                with_timers.append((boss, rt))
-            else:
-                # expired: remove entry
-                del respawn_schedule[boss]
-                save_respawn_data()
+    expired = []
+
+    # only bosses with timers need a per-call check; fixed/interval lists are precomputed
+    for boss, rt in respawn_schedule.items():
+        if rt > now:
+            with_timers.append((boss, rt))
         else:
-            without_timers.append((boss, data))
+            # expired: remove after the scan
+            expired.append(boss)
 
-    # sort upcoming
-    with_timers.sort(key=lambda x: x[1])
-    if option and option.lower() == "soon":
-        with_timers = with_timers[:5]
+    if expired:
+        for boss in expired:
+            del respawn_schedule[boss]
+        save_respawn_data()
 
-    today_str = datetime.now(ph_tz).strftime("%B %d (%A)")
-    lines = [f"**⚔️ Boss Respawn Timers — {today_str}**\n"]
+    # sort upcoming (soon only needs the 5 earliest — partial heap select, no full sort)
+    soon = bool(option and option.lower() == "soon")
+    if soon:
+        with_timers = heapq.nsmallest(5, with_timers, key=lambda x: x[1])
+    else:
+        with_timers.sort(key=lambda x: x[1])
 
-    for boss, rt in with_timers:
-        ph_time = rt.astimezone(ph_tz)
-        countdown = format_countdown(rt)
-        lines.append(f"**{ph_time.strftime('%I:%M %p').lstrip('0').lower()}** — {boss.capitalize()} *(in {countdown})*")
+    today_str = datetime.fromtimestamp(now, ph_tz).strftime("%B %d (%A)")
+    lines = [f"**⚔️ Boss Respawn Timers — {today_str}**\n"]
+    lines.extend([format_timer_row(boss, rt, now) for boss, rt in with_timers])
 
     # fixed/no-info (only when not !boss soon)
-    if not option or option.lower() != "soon":
-        fixed_lines = []
-        noinfo_lines = []
-        for boss, data in without_timers:
-            sched = data.get("schedule")
-            if sched:
-                fixed_lines.append(f"🗓️ {boss.capitalize()} — Fixed: {', '.join(sched)}")
-            else:
-                noinfo_lines.append(f"❌ {boss.capitalize()} — No respawn data")
+    if not soon:
+        fixed_lines = [f"🗓️ {info.display} — Fixed: {info.schedule_str}"
+                       for b, info in FIXED_BOSSES if b not in respawn_schedule]
+        noinfo_lines = [f"❌ {info.display} — No respawn data"
+                        for b, info in INTERVAL_BOSSES if b not in respawn_schedule]
         if fixed_lines:
-            lines.append("\n**📌 Fixed Bosses:**")
-            lines.extend(fixed_lines)
+            lines += ["\n**📌 Fixed Bosses:**", *fixed_lines]
         if noinfo_lines:
-            lines.append("\n**❓ No Info Bosses:**")
-            lines.extend(noinfo_lines)
+            lines += ["\n**❓ No Info Bosses:**", *noinfo_lines]
 
-    await ctx.send("\n".join(lines))
+    # one join per message; split only if a large boss list would exceed Discord's limit
+    for message in chunk_lines(lines):
+        await ctx.send(message)
 
 # 5) !next — show next respawn for a boss
 @bot.command(name="next")
@@ -564,28 +987,28 @@ async def next_cmd(ctx, *, boss_raw: str = None):
     if not boss_raw:
         await ctx.send("❌ Usage: `!next <boss>`")
         return
-    boss_key = find_boss(boss_raw)
+    boss_key = find_boss(boss_raw, fuzzy=True)
     if not boss_key:
-        await ctx.send(f"❌ Unknown boss: `{boss_raw}`")
+        await ctx.send(unknown_boss_message(boss_raw))
         return
+    info = BOSSES[boss_key]
     if boss_key not in respawn_schedule:
-        if BOSSES[boss_key].get("schedule"):
-            await ctx.send(f"📅 {boss_key.capitalize()} is fixed-schedule: {', '.join(BOSSES[boss_key]['schedule'])}")
+        if info.schedule:
+            await ctx.send(f"📅 {info.display} is fixed-schedule: {info.schedule_str}")
         else:
-            await ctx.send(f"❌ No respawn info for **{boss_key.capitalize()}**")
+            await ctx.send(f"❌ No respawn info for **{info.display}**")
         return
     rt = respawn_schedule[boss_key]
-    ph_str = rt.astimezone(ph_tz).strftime("%Y-%m-%d %I:%M %p PH")
-    await ctx.send(f"⏳ **{boss_key.capitalize()}** respawns at {ph_str} (in {format_countdown(rt)})")
+    ph_str = format_ph_datetime(datetime.fromtimestamp(rt, timezone.utc))
+    await ctx.send(f"⏳ **{info.display}** respawns at {ph_str} (in {format_countdown(rt)})")
 
 # 6) !setprealert — set pre-alert minutes
 @bot.command(name="setprealert")
 async def setprealert(ctx, minutes: int):
-    global PRE_ALERT_MINUTES
     if minutes < 1:
         await ctx.send("❌ Pre-alert must be at least 1 minute.")
         return
-    PRE_ALERT_MINUTES = minutes
+    pre_alert.minutes = minutes
     await ctx.send(f"✅ Pre-alert set to {minutes} minute(s).")
 
 # 7) !commands — show help
@@ -629,6 +1052,6 @@ async def testchannels(ctx):
 # Startup
 # ------------------------------
 
-# Load saved schedule then start bot
-load_respawn_data()
+# Start bot (saved schedule loads in setup_hook); make sure a pending debounced save isn't lost on exit
+atexit.register(flush_respawn_data)
 bot.run(TOKEN)
\ No newline at end of file